@@ -13,17 +13,22 @@ Approach:
 import os
 import sys
 import re
+import json
+import base64
 import time
 import smtplib
+import threading
 from datetime import datetime, timedelta
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from difflib import SequenceMatcher
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from itertools import groupby, islice
 
 import feedparser
-import requests
+import httpx
 from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -41,6 +46,20 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
 }
 
+# Shared HTTP client - keeps connections alive and negotiates HTTP/2 where
+# the host supports it, so repeat requests to the same host (HN, Reddit,
+# arXiv, news sites hit by both RSS and enrichment) share one TLS session
+CLIENT = httpx.Client(
+    headers=HEADERS,
+    timeout=10,
+    follow_redirects=True,
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=1,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    ),
+)
+
 # Categories for organization
 CATEGORY_NEW_TECH = "New Technology"
 CATEGORY_RESEARCH = "Research"
@@ -48,24 +67,61 @@ CATEGORY_INDUSTRY = "Industry & Macro"
 CATEGORY_COMMUNITY = "Community Highlights"
 
 
+@dataclass(slots=True)
+class Article:
+    """A single digest item from any source."""
+    title: str
+    link: str
+    summary: str
+    source: str
+    category: str
+    published: datetime
+    engagement: int = 0
+    needs_summary: bool = False
+    score: float = 0.0
+    hn_comments: int = 0
+    hn_id: int | None = None
+    reddit_comments: int = 0
+
+
+# Precompiled patterns
+_WORD_RE = re.compile(r'\w+')
+_SENTENCE_END_RE = re.compile(r'.*[.?!]', re.S)
+
+
+# Fetchers log from worker threads; serialise writes so lines don't interleave
+_log_lock = threading.Lock()
+
+
 def log(message: str) -> None:
     """Log message with timestamp."""
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"[{timestamp}] {message}")
+    with _log_lock:
+        print(f"[{timestamp}] {message}", flush=True)
+
+
+def make_soup(html_text: str) -> BeautifulSoup:
+    """Parse HTML with the fast lxml backend, falling back to html.parser."""
+    try:
+        return BeautifulSoup(html_text, "lxml")
+    except Exception:
+        return BeautifulSoup(html_text, "html.parser")
 
 
 def clean_html(html_text: str) -> str:
     """Clean HTML and return plain text."""
     if not html_text:
         return ""
-    soup = BeautifulSoup(html_text, "html.parser")
+    # Plain text with no tags or entities needs no parser
+    if "<" not in html_text and "&" not in html_text:
+        return " ".join(html_text.split())
+    soup = make_soup(html_text)
     # Remove script and style elements
     for element in soup(["script", "style", "nav", "header", "footer"]):
         element.decompose()
     text = soup.get_text(separator=" ", strip=True)
-    # Clean up whitespace
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
+    # Clean up whitespace (str.split collapses runs without the regex engine)
+    return " ".join(text.split())
 
 
 def truncate_summary(text: str, max_length: int = 280) -> str:
@@ -75,11 +131,9 @@ def truncate_summary(text: str, max_length: int = 280) -> str:
 
     # Try to cut at sentence boundary
     truncated = text[:max_length]
-    last_period = truncated.rfind('.')
-    last_question = truncated.rfind('?')
-    last_exclaim = truncated.rfind('!')
-
-    cut_point = max(last_period, last_question, last_exclaim)
+    # Greedy match ends on the last '.', '?' or '!' in a single pass
+    match = _SENTENCE_END_RE.match(truncated)
+    cut_point = match.end() - 1 if match else -1
     if cut_point > max_length * 0.5:
         return text[:cut_point + 1]
 
@@ -93,28 +147,33 @@ def truncate_summary(text: str, max_length: int = 280) -> str:
 def fetch_article_summary(url: str, timeout: int = 5) -> str:
     """Fetch and extract summary from article URL."""
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=timeout)
+        resp = CLIENT.get(url, timeout=timeout)
         if resp.status_code != 200:
             return ""
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        # Only a couple of meta tags and paragraphs are needed, so query
+        # lxml directly rather than building a full soup
+        # Decode with the HTTP charset when given; otherwise lxml falls back
+        # to the page's own <meta charset>
+        parser = lxml_html.HTMLParser(encoding=resp.charset_encoding)
+        tree = lxml_html.fromstring(resp.content, parser=parser)
 
         # Try meta description first
-        meta_desc = soup.find("meta", attrs={"name": "description"})
-        if meta_desc and meta_desc.get("content"):
-            return clean_html(meta_desc["content"])
+        meta_desc = tree.xpath('//meta[@name="description"]/@content')
+        if meta_desc and meta_desc[0]:
+            return clean_html(meta_desc[0])
 
         # Try og:description
-        og_desc = soup.find("meta", attrs={"property": "og:description"})
-        if og_desc and og_desc.get("content"):
-            return clean_html(og_desc["content"])
+        og_desc = tree.xpath('//meta[@property="og:description"]/@content')
+        if og_desc and og_desc[0]:
+            return clean_html(og_desc[0])
 
         # Try first paragraph
-        article = soup.find("article") or soup.find("main") or soup.body
-        if article:
-            paragraphs = article.find_all("p")
-            for p in paragraphs[:3]:
-                text = clean_html(str(p))
+        containers = tree.xpath("//article") or tree.xpath("//main") or tree.xpath("//body")
+        if containers:
+            paragraphs = containers[0].iter("p")
+            for p in islice(paragraphs, 3):
+                text = " ".join(p.text_content().split())
                 if len(text) > 100:
                     return truncate_summary(text)
 
@@ -123,6 +182,65 @@ def fetch_article_summary(url: str, timeout: int = 5) -> str:
         return ""
 
 
+# =============================================================================
+# FEED CACHE - Conditional GETs with ETag / Last-Modified
+# =============================================================================
+
+FEED_CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".tmp", "feed_cache.json")
+
+# url -> {"etag", "last_modified", "body" (base64)}
+_feed_cache: dict[str, dict] = {}
+
+
+def load_feed_cache() -> None:
+    """Load cached feed bodies and validators from .tmp."""
+    try:
+        with open(FEED_CACHE_PATH, encoding="utf-8") as f:
+            _feed_cache.update(json.load(f))
+    except (OSError, ValueError):
+        pass
+
+
+def save_feed_cache() -> None:
+    """Persist cached feed bodies and validators to .tmp."""
+    try:
+        os.makedirs(os.path.dirname(FEED_CACHE_PATH), exist_ok=True)
+        with open(FEED_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(_feed_cache, f)
+    except OSError as e:
+        log(f"Error saving feed cache: {e}")
+
+
+def fetch_feed(url: str, timeout: int = 10) -> tuple[int, bytes]:
+    """Fetch a feed body, revalidating any cached copy.
+
+    Returns (status_code, body). On 304 Not Modified the cached body is
+    returned, so callers should treat 200 and 304 as success.
+    """
+    cached = _feed_cache.get(url)
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    resp = CLIENT.get(url, headers=headers, timeout=timeout)
+    if resp.status_code == 304 and cached:
+        return 304, base64.b64decode(cached["body"])
+
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if resp.status_code == 200 and (etag or last_modified):
+        _feed_cache[url] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": base64.b64encode(resp.content).decode("ascii"),
+        }
+
+    return resp.status_code, resp.content
+
+
 # =============================================================================
 # RSS FEEDS - AI-Specific Sources (no keyword filtering needed)
 # =============================================================================
@@ -145,55 +263,71 @@ RSS_FEEDS_BLOGS = {
 }
 
 
-def fetch_rss_feeds() -> list[dict]:
-    """Fetch articles from RSS feeds with proper summaries."""
+def fetch_rss_feed(source: str, url: str, now: datetime, cutoff: datetime) -> list[Article]:
+    """Fetch articles from a single RSS feed."""
     articles = []
-    all_feeds = {**RSS_FEEDS_NEWS, **RSS_FEEDS_BLOGS}
 
-    for source, url in all_feeds.items():
-        try:
-            log(f"Fetching RSS: {source}")
-            feed = feedparser.parse(url)
+    try:
+        log(f"Fetching RSS: {source}")
+        status, content = fetch_feed(url)
+        if status not in (200, 304):
+            log(f"{source} returned {status}")
+            return articles
 
-            is_blog = source in RSS_FEEDS_BLOGS
-            category = CATEGORY_NEW_TECH if is_blog else CATEGORY_INDUSTRY
+        feed = feedparser.parse(content)
 
-            for entry in feed.entries[:8]:
-                published = entry.get("published_parsed") or entry.get("updated_parsed")
-                if published:
-                    pub_date = datetime(*published[:6])
-                else:
-                    pub_date = datetime.now()
+        is_blog = source in RSS_FEEDS_BLOGS
+        category = CATEGORY_NEW_TECH if is_blog else CATEGORY_INDUSTRY
 
-                # Skip articles older than 48 hours
-                if (datetime.now() - pub_date).total_seconds() > 48 * 3600:
-                    continue
+        for entry in feed.entries[:8]:
+            published = entry.get("published_parsed") or entry.get("updated_parsed")
+            if published:
+                pub_date = datetime(*published[:6])
+            else:
+                pub_date = now
 
-                # Get summary from feed
-                summary = entry.get("summary", entry.get("description", ""))
-                summary = clean_html(summary)
-                summary = truncate_summary(summary)
+            # Skip articles older than 48 hours, before any HTML cleanup
+            if pub_date < cutoff:
+                continue
 
-                # If summary is too short, it's probably not useful
-                if len(summary) < 50:
-                    summary = ""
+            # Get summary from feed
+            summary = entry.get("summary", entry.get("description", ""))
+            summary = clean_html(summary)
+            summary = truncate_summary(summary)
+
+            # If summary is too short, it's probably not useful
+            if len(summary) < 50:
+                summary = ""
+
+            articles.append(Article(
+                title=clean_html(entry.get("title", "No title")),
+                link=entry.get("link", ""),
+                summary=summary,
+                source=source,
+                category=category,
+                published=pub_date,
+                engagement=0,
+                needs_summary=len(summary) < 100,
+            ))
 
-                articles.append({
-                    "title": clean_html(entry.get("title", "No title")),
-                    "link": entry.get("link", ""),
-                    "summary": summary,
-                    "source": source,
-                    "category": category,
-                    "published": pub_date,
-                    "engagement": 0,
-                    "needs_summary": len(summary) < 100,
-                })
+    except Exception as e:
+        log(f"Error fetching {source}: {e}")
 
-            time.sleep(0.3)
+    return articles
 
-        except Exception as e:
-            log(f"Error fetching {source}: {e}")
-            continue
+
+def fetch_rss_feeds() -> list[Article]:
+    """Fetch articles from RSS feeds with proper summaries."""
+    articles = []
+    all_feeds = {**RSS_FEEDS_NEWS, **RSS_FEEDS_BLOGS}
+    now = datetime.now()
+    cutoff = now - timedelta(hours=48)
+
+    # Every feed lives on its own host, so fetch them all at once
+    with ThreadPoolExecutor(max_workers=len(all_feeds)) as executor:
+        futures = [executor.submit(fetch_rss_feed, source, url, now, cutoff) for source, url in all_feeds.items()]
+        for future in futures:
+            articles.extend(future.result())
 
     return articles
 
@@ -202,9 +336,10 @@ def fetch_rss_feeds() -> list[dict]:
 # ARXIV - Academic Papers
 # =============================================================================
 
-def fetch_arxiv() -> list[dict]:
+def fetch_arxiv() -> list[Article]:
     """Fetch recent AI papers from arXiv."""
     articles = []
+    cutoff = datetime.now() - timedelta(days=7)
 
     # arXiv categories for AI/ML
     categories = ["cs.AI", "cs.LG", "cs.CL", "cs.CV"]
@@ -216,44 +351,41 @@ def fetch_arxiv() -> list[dict]:
         query = "+OR+".join([f"cat:{cat}" for cat in categories])
         url = f"http://export.arxiv.org/api/query?search_query={query}&sortBy=submittedDate&sortOrder=descending&max_results=30"
 
-        resp = requests.get(url, headers=HEADERS, timeout=15)
-        if resp.status_code != 200:
-            log(f"arXiv returned {resp.status_code}")
+        status, content = fetch_feed(url, timeout=15)
+        if status not in (200, 304):
+            log(f"arXiv returned {status}")
             return articles
 
-        soup = BeautifulSoup(resp.text, "xml")
-        entries = soup.find_all("entry")
+        feed = feedparser.parse(content)
 
-        for entry in entries:
+        for entry in feed.entries:
             try:
-                title = entry.find("title").text.strip().replace("\n", " ")
-                title = re.sub(r'\s+', ' ', title)
+                # Parse date first so stale entries skip the text cleanup
+                # (feedparser normalises to UTC)
+                pub_date = datetime(*entry.published_parsed[:6])
 
-                # Get abstract as summary
-                abstract = entry.find("summary").text.strip()
-                abstract = re.sub(r'\s+', ' ', abstract)
-                summary = truncate_summary(abstract, 300)
+                # Skip if older than 7 days (arXiv has weekend delays)
+                if pub_date < cutoff:
+                    continue
 
-                link = entry.find("id").text.strip()
+                title = " ".join(entry.title.split())
 
-                # Parse date
-                published_str = entry.find("published").text
-                pub_date = datetime.fromisoformat(published_str.replace("Z", "+00:00")).replace(tzinfo=None)
+                # Get abstract as summary
+                abstract = " ".join(entry.summary.split())
+                summary = truncate_summary(abstract, 300)
 
-                # Skip if older than 7 days (arXiv has weekend delays)
-                if (datetime.now() - pub_date).total_seconds() > 7 * 24 * 3600:
-                    continue
+                link = entry.id
 
-                articles.append({
-                    "title": title,
-                    "link": link,
-                    "summary": summary,
-                    "source": "arXiv",
-                    "category": CATEGORY_RESEARCH,
-                    "published": pub_date,
-                    "engagement": 0,
-                    "needs_summary": False,
-                })
+                articles.append(Article(
+                    title=title,
+                    link=link,
+                    summary=summary,
+                    source="arXiv",
+                    category=CATEGORY_RESEARCH,
+                    published=pub_date,
+                    engagement=0,
+                    needs_summary=False,
+                ))
 
             except Exception:
                 continue
@@ -270,47 +402,54 @@ def fetch_arxiv() -> list[dict]:
 # PAPERS WITH CODE - Trending Research
 # =============================================================================
 
-def fetch_papers_with_code() -> list[dict]:
+def fetch_papers_with_code() -> list[Article]:
     """Fetch trending papers from Papers With Code via RSS."""
     articles = []
+    now = datetime.now()
+    cutoff = now - timedelta(days=7)
 
     try:
         log("Fetching Papers With Code trending")
 
         # Use the RSS feed which is more reliable
-        feed = feedparser.parse("https://paperswithcode.com/rss.xml")
+        status, content = fetch_feed("https://paperswithcode.com/rss.xml")
+        if status not in (200, 304):
+            log(f"Papers With Code returned {status}")
+            return articles
+
+        feed = feedparser.parse(content)
 
         for entry in feed.entries[:15]:
             try:
-                title = entry.get("title", "")
-                summary = clean_html(entry.get("summary", ""))
-                summary = truncate_summary(summary, 300)
-
                 link = entry.get("link", "")
                 if not link:
                     continue
 
-                # Parse date
+                # Parse date first so stale entries skip the HTML cleanup
                 published = entry.get("published_parsed")
                 if published:
                     pub_date = datetime(*published[:6])
                 else:
-                    pub_date = datetime.now()
+                    pub_date = now
 
                 # Skip if older than 7 days
-                if (datetime.now() - pub_date).total_seconds() > 7 * 24 * 3600:
+                if pub_date < cutoff:
                     continue
 
-                articles.append({
-                    "title": title,
-                    "link": link,
-                    "summary": summary,
-                    "source": "Papers With Code",
-                    "category": CATEGORY_RESEARCH,
-                    "published": pub_date,
-                    "engagement": 0,
-                    "needs_summary": len(summary) < 100,
-                })
+                title = entry.get("title", "")
+                summary = clean_html(entry.get("summary", ""))
+                summary = truncate_summary(summary, 300)
+
+                articles.append(Article(
+                    title=title,
+                    link=link,
+                    summary=summary,
+                    source="Papers With Code",
+                    category=CATEGORY_RESEARCH,
+                    published=pub_date,
+                    engagement=0,
+                    needs_summary=len(summary) < 100,
+                ))
 
             except Exception:
                 continue
@@ -327,87 +466,85 @@ def fetch_papers_with_code() -> list[dict]:
 # HACKER NEWS - AI Stories with actual content
 # =============================================================================
 
-def fetch_hacker_news() -> list[dict]:
+# AI-related terms for HN filtering (since HN is general)
+# Be more specific to avoid false positives
+HN_AI_TERMS = [
+    " ai ", "a]i", "[ai", "ai,",  # Ensure "ai" is standalone
+    "gpt-", "gpt4", "gpt3", "chatgpt", "llm", "llama",
+    "claude", "gemini", "openai", "anthropic", "deepmind",
+    "machine learning", "deep learning", "neural net",
+    "transformer", "diffusion model", "stable diffusion",
+    "midjourney", "copilot", "language model", "hugging face",
+    "agi", "alignment", "multimodal", "generative ai",
+    "fine-tun", "fine tun", "embedding", "rag ", "vector db"
+]
+
+# Generic tech terms that slip through the AI filter
+HN_EXCLUDE_TERMS = ["bluetooth", "bitcoin", "crypto", "blockchain", "vpn", "browser"]
+
+# One alternation per list, so each title is scanned once instead of per term
+_HN_AI_RE = re.compile("|".join(map(re.escape, HN_AI_TERMS)))
+_HN_EXCLUDE_RE = re.compile("|".join(map(re.escape, HN_EXCLUDE_TERMS)))
+
+
+def fetch_hacker_news() -> list[Article]:
     """Fetch top AI stories from Hacker News with summaries."""
     articles = []
-
-    # AI-related terms for HN filtering (since HN is general)
-    # Be more specific to avoid false positives
-    ai_terms = [
-        " ai ", "a]i", "[ai", "ai,",  # Ensure "ai" is standalone
-        "gpt-", "gpt4", "gpt3", "chatgpt", "llm", "llama",
-        "claude", "gemini", "openai", "anthropic", "deepmind",
-        "machine learning", "deep learning", "neural net",
-        "transformer", "diffusion model", "stable diffusion",
-        "midjourney", "copilot", "language model", "hugging face",
-        "agi", "alignment", "multimodal", "generative ai",
-        "fine-tun", "fine tun", "embedding", "rag ", "vector db"
-    ]
+    cutoff_ts = time.time() - 48 * 3600
 
     try:
-        log("Fetching Hacker News top stories")
+        log("Fetching Hacker News front page")
 
-        resp = requests.get(
-            "https://hacker-news.firebaseio.com/v0/topstories.json",
-            headers=HEADERS,
+        # Algolia's HN search returns title, points and time for every
+        # front-page story in one call, instead of one GET per item
+        resp = CLIENT.get(
+            "https://hn.algolia.com/api/v1/search",
+            params={"tags": "front_page", "hitsPerPage": 50},
             timeout=10
         )
-        story_ids = resp.json()[:100]  # Check more to find AI stories
+        hits = resp.json().get("hits", [])
 
-        for story_id in story_ids:
+        for hit in hits:
             if len(articles) >= 10:  # Limit HN articles
                 break
 
             try:
-                story_resp = requests.get(
-                    f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json",
-                    headers=HEADERS,
-                    timeout=5
-                )
-                story = story_resp.json()
-
-                if not story or story.get("type") != "story":
-                    continue
-
-                title = story.get("title", "").lower()
+                title = (hit.get("title") or "").lower()
 
                 # Check if AI-related (need at least one strong signal)
-                is_ai = any(term in title for term in ai_terms)
-                if not is_ai:
+                if not _HN_AI_RE.search(title):
                     continue
 
                 # Additional check: avoid generic tech terms that slip through
-                generic_terms = ["bluetooth", "bitcoin", "crypto", "blockchain", "vpn", "browser"]
-                if any(term in title for term in generic_terms):
+                if _HN_EXCLUDE_RE.search(title):
                     continue
 
                 # Must have decent engagement
-                score = story.get("score", 0)
+                score = hit.get("points") or 0
                 if score < 50:
                     continue
 
-                pub_time = datetime.fromtimestamp(story.get("time", 0))
-
-                # Skip if older than 48 hours
-                if (datetime.now() - pub_time).total_seconds() > 48 * 3600:
+                # Skip if older than 48 hours (compare raw epoch seconds)
+                story_time = hit.get("created_at_i", 0)
+                if story_time < cutoff_ts:
                     continue
 
-                url = story.get("url", f"https://news.ycombinator.com/item?id={story_id}")
-
-                articles.append({
-                    "title": story.get("title", ""),
-                    "link": url,
-                    "summary": "",  # Will fetch later
-                    "source": "Hacker News",
-                    "category": CATEGORY_COMMUNITY,
-                    "published": pub_time,
-                    "engagement": score,
-                    "needs_summary": True,
-                    "hn_comments": story.get("descendants", 0),
-                    "hn_id": story_id,
-                })
-
-                time.sleep(0.05)
+                story_id = int(hit["objectID"])
+                pub_time = datetime.fromtimestamp(story_time)
+                url = hit.get("url") or f"https://news.ycombinator.com/item?id={story_id}"
+
+                articles.append(Article(
+                    title=hit["title"],
+                    link=url,
+                    summary="",  # Will fetch later
+                    source="Hacker News",
+                    category=CATEGORY_COMMUNITY,
+                    published=pub_time,
+                    engagement=score,
+                    needs_summary=True,
+                    hn_comments=hit.get("num_comments") or 0,
+                    hn_id=story_id,
+                ))
 
             except Exception:
                 continue
@@ -424,9 +561,27 @@ def fetch_hacker_news() -> list[dict]:
 # REDDIT - AI Subreddits
 # =============================================================================
 
-def fetch_reddit() -> list[dict]:
+# Reddit's unauthenticated JSON API rate limits aggressively, so requests to
+# it are spaced out; no other host is throttled
+REDDIT_MIN_INTERVAL = 1.0
+_reddit_lock = threading.Lock()
+_reddit_last_request = 0.0
+
+
+def reddit_throttle() -> None:
+    """Block until REDDIT_MIN_INTERVAL has passed since the last Reddit request."""
+    global _reddit_last_request
+    with _reddit_lock:
+        wait = _reddit_last_request + REDDIT_MIN_INTERVAL - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _reddit_last_request = time.monotonic()
+
+
+def fetch_reddit() -> list[Article]:
     """Fetch top posts from AI subreddits."""
     articles = []
+    cutoff_ts = time.time() - 48 * 3600
 
     # Focused subreddits - these are AI-specific so no keyword filtering needed
     subreddits = [
@@ -439,11 +594,11 @@ def fetch_reddit() -> list[dict]:
 
     for subreddit, category in subreddits:
         try:
+            reddit_throttle()
             log(f"Fetching Reddit r/{subreddit}")
 
-            resp = requests.get(
+            resp = CLIENT.get(
                 f"https://www.reddit.com/r/{subreddit}/hot.json?limit=15",
-                headers=HEADERS,
                 timeout=10
             )
 
@@ -465,12 +620,13 @@ def fetch_reddit() -> list[dict]:
                 if score < 50:
                     continue
 
-                pub_time = datetime.fromtimestamp(post_data.get("created_utc", 0))
-
-                # Skip if older than 48 hours
-                if (datetime.now() - pub_time).total_seconds() > 48 * 3600:
+                # Skip if older than 48 hours (compare raw epoch seconds)
+                created_utc = post_data.get("created_utc", 0)
+                if created_utc < cutoff_ts:
                     continue
 
+                pub_time = datetime.fromtimestamp(created_utc)
+
                 # Get summary from selftext or external link
                 selftext = post_data.get("selftext", "")
                 if selftext and len(selftext) > 50:
@@ -483,19 +639,17 @@ def fetch_reddit() -> list[dict]:
                 if "reddit.com" in url or not url:
                     url = f"https://reddit.com{post_data.get('permalink', '')}"
 
-                articles.append({
-                    "title": post_data.get("title", "No title"),
-                    "link": url,
-                    "summary": summary,
-                    "source": f"r/{subreddit}",
-                    "category": category,
-                    "published": pub_time,
-                    "engagement": score,
-                    "needs_summary": len(summary) < 100,
-                    "reddit_comments": post_data.get("num_comments", 0),
-                })
-
-            time.sleep(1)  # Reddit rate limiting
+                articles.append(Article(
+                    title=post_data.get("title", "No title"),
+                    link=url,
+                    summary=summary,
+                    source=f"r/{subreddit}",
+                    category=category,
+                    published=pub_time,
+                    engagement=score,
+                    needs_summary=len(summary) < 100,
+                    reddit_comments=post_data.get("num_comments", 0),
+                ))
 
         except Exception as e:
             log(f"Error fetching r/{subreddit}: {e}")
@@ -508,9 +662,9 @@ def fetch_reddit() -> list[dict]:
 # SUMMARY ENRICHMENT
 # =============================================================================
 
-def enrich_summaries(articles: list[dict]) -> list[dict]:
+def enrich_summaries(articles: list[Article]) -> list[Article]:
     """Fetch summaries for articles that need them."""
-    needs_summary = [a for a in articles if a.get("needs_summary") and a.get("link")]
+    needs_summary = [a for a in articles if a.needs_summary and a.link]
 
     if not needs_summary:
         return articles
@@ -518,17 +672,19 @@ def enrich_summaries(articles: list[dict]) -> list[dict]:
     log(f"Enriching {len(needs_summary)} articles with summaries")
 
     def fetch_one(article):
-        if "reddit.com" in article["link"] or "news.ycombinator.com" in article["link"]:
+        if "reddit.com" in article.link or "news.ycombinator.com" in article.link:
             return article  # Skip Reddit/HN comment pages
-        summary = fetch_article_summary(article["link"])
+        summary = fetch_article_summary(article.link)
         if summary:
-            article["summary"] = summary
-            article["needs_summary"] = False
+            article.summary = summary
+            article.needs_summary = False
         return article
 
-    # Parallel fetch with thread pool
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        futures = {executor.submit(fetch_one, a): a for a in needs_summary[:20]}
+    # Parallel fetch with thread pool - one worker per article so every page
+    # is in flight at once over the shared client's connection pool
+    batch = needs_summary[:20]
+    with ThreadPoolExecutor(max_workers=len(batch)) as executor:
+        futures = {executor.submit(fetch_one, a): a for a in batch}
         for future in as_completed(futures, timeout=30):
             try:
                 future.result()
@@ -542,12 +698,13 @@ def enrich_summaries(articles: list[dict]) -> list[dict]:
 # SCORING AND RANKING
 # =============================================================================
 
-def calculate_score(article: dict) -> float:
+def calculate_score(article: Article, now: datetime | None = None) -> float:
     """Calculate relevance score based on engagement and recency."""
     score = 0.0
+    now = now or datetime.now()
 
     # Recency score (0-40 points)
-    hours_old = (datetime.now() - article["published"]).total_seconds() / 3600
+    hours_old = (now - article.published).total_seconds() / 3600
     if hours_old <= 12:
         score += 40
     elif hours_old <= 24:
@@ -558,7 +715,7 @@ def calculate_score(article: dict) -> float:
         score += 10
 
     # Engagement score (0-40 points)
-    engagement = article.get("engagement", 0)
+    engagement = article.engagement
     if engagement > 500:
         score += 40
     elif engagement > 200:
@@ -573,36 +730,47 @@ def calculate_score(article: dict) -> float:
         "OpenAI Blog", "Anthropic Research", "Google AI Blog", "DeepMind Blog",
         "MIT Tech Review", "arXiv", "Papers With Code"
     ]
-    if article["source"] in high_quality_sources:
+    if article.source in high_quality_sources:
         score += 20
-    elif article["source"] in RSS_FEEDS_NEWS:
+    elif article.source in RSS_FEEDS_NEWS:
         score += 10
 
     # Has good summary bonus
-    if article.get("summary") and len(article["summary"]) > 100:
+    if article.summary and len(article.summary) > 100:
         score += 10
 
     return score
 
 
-def deduplicate_articles(articles: list[dict]) -> list[dict]:
+def title_tokens(title: str) -> frozenset[str]:
+    """Return the set of significant lowercase words in a title."""
+    return frozenset(tok for tok in _WORD_RE.findall(title.lower()) if len(tok) > 2)
+
+
+def deduplicate_articles(articles: list[Article]) -> list[Article]:
     """Remove duplicate or very similar articles."""
     unique = []
-    seen_titles = []
+    seen_titles = set()
+    seen_tokens = []
 
     for article in articles:
-        title = article["title"].lower()
-
-        is_duplicate = False
-        for seen in seen_titles:
-            similarity = SequenceMatcher(None, title, seen).ratio()
-            if similarity > 0.6:
-                is_duplicate = True
-                break
+        title = article.title.lower()
+        tokens = title_tokens(title)
+
+        # Exact repeats first, then Jaccard similarity of the word sets
+        is_duplicate = title in seen_titles
+        if not is_duplicate and tokens:
+            for seen in seen_tokens:
+                similarity = len(tokens & seen) / len(tokens | seen)
+                if similarity > 0.5:
+                    is_duplicate = True
+                    break
 
         if not is_duplicate:
             unique.append(article)
-            seen_titles.append(title)
+            seen_titles.add(title)
+            if tokens:
+                seen_tokens.append(tokens)
 
     return unique
 
@@ -611,16 +779,24 @@ def deduplicate_articles(articles: list[dict]) -> list[dict]:
 # EMAIL FORMATTING
 # =============================================================================
 
-def format_html_email(articles: list[dict]) -> str:
-    """Format articles into Morning Brew style HTML email."""
+# Display order of digest sections
+CATEGORY_ORDER = [CATEGORY_NEW_TECH, CATEGORY_RESEARCH, CATEGORY_INDUSTRY, CATEGORY_COMMUNITY]
+_CATEGORY_RANK = {category: i for i, category in enumerate(CATEGORY_ORDER)}
 
-    # Group by category
-    by_category = {}
-    for article in articles:
-        cat = article["category"]
-        if cat not in by_category:
-            by_category[cat] = []
-        by_category[cat].append(article)
+
+def top_by_category(articles: list[Article], limit: int = 5):
+    """Yield (category, top articles) pairs in display order, best score first."""
+    ranked = sorted(articles, key=lambda a: (
+        _CATEGORY_RANK.get(a.category, len(CATEGORY_ORDER)),
+        a.category,
+        -a.score,
+    ))
+    for category, group in groupby(ranked, key=lambda a: a.category):
+        yield category, list(islice(group, limit))
+
+
+def format_html_email(articles: list[Article]) -> str:
+    """Format articles into Morning Brew style HTML email."""
 
     today = datetime.now().strftime("%B %d, %Y")
 
@@ -632,7 +808,7 @@ def format_html_email(articles: list[dict]) -> str:
         CATEGORY_COMMUNITY: {"icon": "💬", "color": "#f59e0b"},
     }
 
-    html = f"""<!DOCTYPE html>
+    parts = [f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
@@ -650,53 +826,46 @@ def format_html_email(articles: list[dict]) -> str:
             Good morning! Here's what's happening in AI today — new releases, research breakthroughs, and the conversations that matter.
         </p>
     </div>
-"""
-
-    # Order categories
-    category_order = [CATEGORY_NEW_TECH, CATEGORY_RESEARCH, CATEGORY_INDUSTRY, CATEGORY_COMMUNITY]
-
-    for category in category_order:
-        if category not in by_category:
-            continue
+"""]
 
-        cat_articles = by_category[category][:5]  # Max 5 per category
+    for category, cat_articles in top_by_category(articles):
         style = category_styles.get(category, {"icon": "📌", "color": "#6b7280"})
 
-        html += f"""
+        parts.append(f"""
     <div style="background: white; padding: 24px; border-radius: 12px; margin-bottom: 20px; border: 1px solid #e5e7eb;">
         <h2 style="color: {style['color']}; margin: 0 0 20px 0; font-size: 18px; font-weight: 600; display: flex; align-items: center; gap: 8px;">
             <span>{style['icon']}</span> {category}
         </h2>
-"""
+""")
 
         for article in cat_articles:
             summary_html = ""
-            if article.get("summary"):
-                summary_html = f"""<p style="color: #6b7280; margin: 8px 0; font-size: 14px; line-height: 1.6;">{article['summary']}</p>"""
+            if article.summary:
+                summary_html = f"""<p style="color: #6b7280; margin: 8px 0; font-size: 14px; line-height: 1.6;">{article.summary}</p>"""
 
             # Format engagement info
-            meta_parts = [article["source"]]
-            if article.get("engagement"):
-                if "r/" in article["source"]:
-                    meta_parts.append(f"↑{article['engagement']}")
-                elif article["source"] == "Hacker News":
-                    meta_parts.append(f"{article['engagement']} pts")
-            meta_parts.append(article["published"].strftime("%b %d"))
-
-            html += f"""
+            meta_parts = [article.source]
+            if article.engagement:
+                if "r/" in article.source:
+                    meta_parts.append(f"↑{article.engagement}")
+                elif article.source == "Hacker News":
+                    meta_parts.append(f"{article.engagement} pts")
+            meta_parts.append(article.published.strftime("%b %d"))
+
+            parts.append(f"""
         <div style="margin-bottom: 20px; padding-bottom: 20px; border-bottom: 1px solid #f3f4f6;">
-            <a href="{article['link']}" style="text-decoration: none;">
-                <h3 style="color: #111827; margin: 0; font-size: 15px; font-weight: 600; line-height: 1.5;">{article['title']}</h3>
+            <a href="{article.link}" style="text-decoration: none;">
+                <h3 style="color: #111827; margin: 0; font-size: 15px; font-weight: 600; line-height: 1.5;">{article.title}</h3>
             </a>
             {summary_html}
             <p style="color: #9ca3af; margin: 8px 0 0 0; font-size: 12px;">{' · '.join(meta_parts)}</p>
         </div>
-"""
+""")
 
-        html += "    </div>\n"
+        parts.append("    </div>\n")
 
     # Footer
-    html += """
+    parts.append("""
     <div style="text-align: center; padding: 24px; color: #9ca3af; font-size: 12px;">
         <p style="margin: 0;">Generated by AI News Digest</p>
         <p style="margin: 4px 0 0 0;">Curated from arXiv, tech news, and community discussions</p>
@@ -704,37 +873,29 @@ def format_html_email(articles: list[dict]) -> str:
 
 </body>
 </html>
-"""
+""")
 
-    return html
+    return "".join(parts)
 
 
-def format_plain_text(articles: list[dict]) -> str:
+def format_plain_text(articles: list[Article]) -> str:
     """Format articles as plain text fallback."""
     today = datetime.now().strftime("%B %d, %Y")
 
-    text = f"""AI DAILY DIGEST - {today}
+    parts = [f"""AI DAILY DIGEST - {today}
 {'=' * 50}
 
-"""
-
-    # Group by category
-    by_category = {}
-    for article in articles:
-        cat = article["category"]
-        if cat not in by_category:
-            by_category[cat] = []
-        by_category[cat].append(article)
+"""]
 
-    for category, cat_articles in by_category.items():
-        text += f"\n{category.upper()}\n{'-' * 40}\n\n"
-        for article in cat_articles[:5]:
-            text += f"• {article['title']}\n"
-            if article.get("summary"):
-                text += f"  {article['summary'][:200]}...\n"
-            text += f"  {article['source']} | {article['link']}\n\n"
+    for category, cat_articles in top_by_category(articles):
+        parts.append(f"\n{category.upper()}\n{'-' * 40}\n\n")
+        for article in cat_articles:
+            parts.append(f"• {article.title}\n")
+            if article.summary:
+                parts.append(f"  {article.summary[:200]}...\n")
+            parts.append(f"  {article.source} | {article.link}\n\n")
 
-    return text
+    return "".join(parts)
 
 
 # =============================================================================
@@ -798,12 +959,18 @@ def main():
     # Fetch from all sources
     all_articles = []
 
-    # Parallel fetch from different source types
-    all_articles.extend(fetch_rss_feeds())
-    all_articles.extend(fetch_arxiv())
-    all_articles.extend(fetch_papers_with_code())
-    all_articles.extend(fetch_hacker_news())
-    all_articles.extend(fetch_reddit())
+    # Reuse feed bodies from earlier runs when the server says unchanged
+    load_feed_cache()
+
+    # Parallel fetch from different source types (collected in a fixed order
+    # so ties in score/dedup resolve the same way every run)
+    fetchers = [fetch_rss_feeds, fetch_arxiv, fetch_papers_with_code, fetch_hacker_news, fetch_reddit]
+    with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+        futures = [executor.submit(fetcher) for fetcher in fetchers]
+        for future in futures:
+            all_articles.extend(future.result())
+
+    save_feed_cache()
 
     log(f"Fetched {len(all_articles)} total articles")
 
@@ -815,11 +982,12 @@ def main():
     all_articles = enrich_summaries(all_articles)
 
     # Calculate scores
+    now = datetime.now()
     for article in all_articles:
-        article["score"] = calculate_score(article)
+        article.score = calculate_score(article, now)
 
     # Sort by score within each category
-    all_articles.sort(key=lambda x: x["score"], reverse=True)
+    all_articles.sort(key=lambda x: x.score, reverse=True)
 
     # Deduplicate
     articles = deduplicate_articles(all_articles)